@@ -8,139 +8,160 @@ import numpy as np
 import wave
 import struct
 import os
+import zlib
+from multiprocessing import Pool
+
+def _geometric(step, n, start=0.0):
+    """Return exp(start + step * k) for k in range(n)"""
+    # Outer product of a coarse and a fine table: only ~2*sqrt(n)
+    # exponentials are evaluated, every other sample is one multiply
+    block = max(1, int(np.sqrt(n)))
+    coarse = np.exp(start + step * np.arange(0, n, block))
+    fine = np.exp(step * np.arange(block))
+    return np.outer(coarse, fine).ravel()[:n]
+
+def _phasor(dphi, n, phase=0.0):
+    """Return exp(1j * (phase + dphi * k)) for k in range(n)"""
+    return _geometric(1j * dphi, n, 1j * phase)
+
+def _noise_rng(filename):
+    """Return a noise generator seeded from the output filename"""
+    # crc32 rather than hash(): str hashes are salted per process
+    return np.random.default_rng(zlib.crc32(os.path.basename(filename).encode()))
+
+def _quantize(audio, amplitude):
+    """Clip audio in place and convert it to 16-bit samples"""
+    np.clip(audio, -1.0, 1.0, out=audio)
+    audio *= amplitude
+    return audio.astype(np.int16)
+
+def _write_wav(filename, audio_16bit, sample_rate):
+    """Write mono 16-bit samples as a stereo WAV file"""
+    # Both channels are identical, so interleave in a single pass
+    with wave.open(filename, 'w') as wav_file:
+        wav_file.setnchannels(2)  # Stereo
+        wav_file.setsampwidth(2)  # 16-bit
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(np.repeat(audio_16bit, 2).tobytes())
 
 def generate_collision_sound(filename, frequency=440, duration=0.3, sample_rate=44100):
     """Generate a simple collision sound effect"""
-    # Generate time array
-    t = np.linspace(0, duration, int(sample_rate * duration))
+    n = int(sample_rate * duration)
+    dt = 1.0 / sample_rate
+    inv_duration = 1.0 / duration
     
     # Create collision sound: quick frequency sweep with decay
     start_freq = frequency * 2  # Start high
     end_freq = frequency * 0.5  # End low
     
-    # Exponential frequency sweep
-    freq_sweep = start_freq * np.exp(-3 * t / duration)
+    # Exponential frequency sweep, as a per-sample phase increment
+    dphi = _geometric(-3 * dt * inv_duration, n)
+    dphi *= 2 * np.pi * start_freq * dt
     
     # Generate sine wave with frequency sweep
-    phase = 2 * np.pi * np.cumsum(freq_sweep) / sample_rate
-    audio = np.sin(phase)
+    audio = np.sin(np.cumsum(dphi))
     
     # Apply exponential decay envelope
-    envelope = np.exp(-5 * t / duration)
-    audio *= envelope
+    audio *= _geometric(-5 * dt * inv_duration, n)
     
-    # Add some noise for texture
-    noise = np.random.normal(0, 0.1, len(audio))
-    audio = 0.8 * audio + 0.2 * noise
+    # Add some noise for texture (mixed in place, 80% tone / 20% noise)
+    noise = _noise_rng(filename).standard_normal(n)
+    audio *= 0.8
+    noise *= 0.2 * 0.1  # sigma 0.1
+    audio += noise
     
     # Normalize and convert to 16-bit
-    audio = np.clip(audio, -1.0, 1.0)
-    audio_16bit = (audio * 32767).astype(np.int16)
-    
-    # Create stereo version
-    stereo_audio = np.zeros((len(audio_16bit), 2), dtype=np.int16)
-    stereo_audio[:, 0] = audio_16bit  # Left channel
-    stereo_audio[:, 1] = audio_16bit  # Right channel
+    audio_16bit = _quantize(audio, 32767)
     
     # Write WAV file
-    with wave.open(filename, 'w') as wav_file:
-        wav_file.setnchannels(2)  # Stereo
-        wav_file.setsampwidth(2)  # 16-bit
-        wav_file.setframerate(sample_rate)
-        wav_file.writeframes(stereo_audio.tobytes())
+    _write_wav(filename, audio_16bit, sample_rate)
     
     print(f"Generated {filename} ({duration:.2f}s, {frequency}Hz collision sound)")
 
 def generate_bounce_sound(filename, frequency=220, duration=0.2, sample_rate=44100):
     """Generate a bounce sound effect"""
-    t = np.linspace(0, duration, int(sample_rate * duration))
+    n = int(sample_rate * duration)
+    dt = 1.0 / sample_rate
     
     # Bounce sound: quick high ping followed by low thump
     ping_duration = 0.05
     thump_start = 0.06
     
-    audio = np.zeros(len(t))
+    audio = np.zeros(n)
     
     # High frequency ping at the beginning
-    ping_mask = t < ping_duration
-    if np.any(ping_mask):
+    ping_samples = min(n, int(np.ceil(ping_duration * sample_rate)))
+    if ping_samples > 0:
         ping_freq = frequency * 4
-        audio[ping_mask] = 0.7 * np.sin(2 * np.pi * ping_freq * t[ping_mask]) * np.exp(-20 * t[ping_mask])
+        ping = _phasor(2 * np.pi * ping_freq * dt, ping_samples).imag
+        ping *= _geometric(-20 * dt, ping_samples)
+        audio[:ping_samples] = 0.7 * ping
     
     # Low frequency thump
-    thump_mask = t >= thump_start
-    if np.any(thump_mask):
-        thump_t = t[thump_mask] - thump_start
+    thump_first = int(np.ceil(thump_start * sample_rate))
+    if thump_first < n:
+        thump_samples = n - thump_first
+        thump_offset = thump_first * dt - thump_start
         thump_freq = frequency * 0.8
-        thump_audio = 0.5 * np.sin(2 * np.pi * thump_freq * thump_t) * np.exp(-8 * thump_t)
-        audio[thump_mask] += thump_audio
+        thump = _phasor(2 * np.pi * thump_freq * dt, thump_samples,
+                        phase=2 * np.pi * thump_freq * thump_offset).imag
+        thump *= _geometric(-8 * dt, thump_samples, -8 * thump_offset)
+        audio[thump_first:] += 0.5 * thump
     
     # Normalize and convert to 16-bit
-    audio = np.clip(audio, -1.0, 1.0)
-    audio_16bit = (audio * 32767).astype(np.int16)
-    
-    # Create stereo version
-    stereo_audio = np.zeros((len(audio_16bit), 2), dtype=np.int16)
-    stereo_audio[:, 0] = audio_16bit
-    stereo_audio[:, 1] = audio_16bit
+    audio_16bit = _quantize(audio, 32767)
     
     # Write WAV file
-    with wave.open(filename, 'w') as wav_file:
-        wav_file.setnchannels(2)
-        wav_file.setsampwidth(2)
-        wav_file.setframerate(sample_rate)
-        wav_file.writeframes(stereo_audio.tobytes())
+    _write_wav(filename, audio_16bit, sample_rate)
     
     print(f"Generated {filename} ({duration:.2f}s, {frequency}Hz bounce sound)")
 
 def generate_ambient_sound(filename, frequency=100, duration=10.0, sample_rate=44100):
     """Generate ambient background sound"""
-    t = np.linspace(0, duration, int(sample_rate * duration))
+    n = int(sample_rate * duration)
+    dphi = 2 * np.pi / sample_rate
     
-    # Create layered ambient sound with multiple sine waves
-    audio = np.zeros(len(t))
+    # Create layered ambient sound with multiple sine waves. Every layer is a
+    # multiple of half the base frequency, so derive them all from one phasor
+    half = _phasor(dphi * frequency * 0.5, n)
+    drone = half * half
     
     # Base low frequency drone
-    audio += 0.3 * np.sin(2 * np.pi * frequency * t)
+    audio = 0.3 * drone.imag
     
     # Add harmonic layers
-    audio += 0.2 * np.sin(2 * np.pi * frequency * 1.5 * t)
-    audio += 0.15 * np.sin(2 * np.pi * frequency * 2.0 * t)
+    audio += 0.2 * (drone * half).imag  # 1.5x
+    drone *= drone  # 2.0x
+    audio += 0.15 * drone.imag
     
     # Add some gentle modulation
-    modulation = 0.1 * np.sin(2 * np.pi * 0.5 * t)  # 0.5 Hz modulation
-    audio *= (1.0 + modulation)
+    modulation = 0.1 * _phasor(dphi * 0.5, n).imag  # 0.5 Hz modulation
+    modulation += 1.0
+    audio *= modulation
     
     # Add subtle noise for texture
-    noise = np.random.normal(0, 0.05, len(audio))
+    noise = _noise_rng(filename).standard_normal(n)
+    noise *= 0.05
     audio += noise
     
     # Apply gentle fade in/out for seamless looping
     fade_samples = int(sample_rate * 0.5)  # 0.5 second fade
     fade_in = np.linspace(0, 1, fade_samples)
-    fade_out = np.linspace(1, 0, fade_samples)
-    
     audio[:fade_samples] *= fade_in
-    audio[-fade_samples:] *= fade_out
+    audio[-fade_samples:] *= fade_in[::-1]
     
-    # Normalize
-    audio = np.clip(audio, -1.0, 1.0)
-    audio_16bit = (audio * 16383).astype(np.int16)  # Quieter ambient sounds
-    
-    # Create stereo version
-    stereo_audio = np.zeros((len(audio_16bit), 2), dtype=np.int16)
-    stereo_audio[:, 0] = audio_16bit
-    stereo_audio[:, 1] = audio_16bit
+    # Normalize and convert to 16-bit
+    audio_16bit = _quantize(audio, 16383)  # Quieter ambient sounds
     
     # Write WAV file
-    with wave.open(filename, 'w') as wav_file:
-        wav_file.setnchannels(2)
-        wav_file.setsampwidth(2)
-        wav_file.setframerate(sample_rate)
-        wav_file.writeframes(stereo_audio.tobytes())
+    _write_wav(filename, audio_16bit, sample_rate)
     
     print(f"Generated {filename} ({duration:.1f}s, {frequency}Hz ambient sound)")
 
+def _dispatch(generator, filename, frequency, duration):
+    """Run one generator job in a worker process"""
+    generator(filename, frequency=frequency, duration=duration)
+
 def main():
     # Create assets/audio directory if it doesn't exist
     audio_dir = "../assets/audio"
@@ -148,14 +169,21 @@ def main():
     
     print("Generating test audio files for CorePulse...")
     
-    # Generate different collision sounds
-    generate_collision_sound(f"{audio_dir}/collision_metal.wav", frequency=800, duration=0.4)
-    generate_collision_sound(f"{audio_dir}/collision_soft.wav", frequency=300, duration=0.3)
-    generate_bounce_sound(f"{audio_dir}/bounce.wav", frequency=240, duration=0.25)
-    
-    # Generate ambient sounds
-    generate_ambient_sound(f"{audio_dir}/ambient_hum.wav", frequency=80, duration=5.0)
-    generate_ambient_sound(f"{audio_dir}/ambient_wind.wav", frequency=120, duration=5.0)
+    jobs = [
+        # Different collision sounds
+        (generate_collision_sound, f"{audio_dir}/collision_metal.wav", 800, 0.4),
+        (generate_collision_sound, f"{audio_dir}/collision_soft.wav", 300, 0.3),
+        (generate_bounce_sound, f"{audio_dir}/bounce.wav", 240, 0.25),
+        
+        # Ambient sounds
+        (generate_ambient_sound, f"{audio_dir}/ambient_hum.wav", 80, 5.0),
+        (generate_ambient_sound, f"{audio_dir}/ambient_wind.wav", 120, 5.0),
+    ]
+    
+    # The files are independent (each seeds its own noise), so render them in parallel
+    workers = min(len(jobs), os.cpu_count() or 1)
+    with Pool(workers, maxtasksperchild=1) as pool:
+        pool.starmap(_dispatch, jobs)
     
     print("\nAudio files generated successfully!")
     print("Files created:")
@@ -3,88 +3,165 @@
 Generate simple test glTF files for validating the CorePulse glTF loader.
 """
 
+import argparse
+import contextlib
 import json
-import struct
+import mmap
 import os
+import struct
+from concurrent.futures import ProcessPoolExecutor
 
-def generate_cube_gltf():
-    """Generate a simple cube glTF file"""
-    
-    # Cube vertices (positions, normals, texture coordinates)
-    vertices = [
-        # Front face
-        [-1, -1,  1,  0,  0,  1,  0, 0],  # 0
-        [ 1, -1,  1,  0,  0,  1,  1, 0],  # 1
-        [ 1,  1,  1,  0,  0,  1,  1, 1],  # 2
-        [-1,  1,  1,  0,  0,  1,  0, 1],  # 3
-        
-        # Back face
-        [-1, -1, -1,  0,  0, -1,  1, 0],  # 4
-        [-1,  1, -1,  0,  0, -1,  1, 1],  # 5
-        [ 1,  1, -1,  0,  0, -1,  0, 1],  # 6
-        [ 1, -1, -1,  0,  0, -1,  0, 0],  # 7
-        
-        # Top face
-        [-1,  1, -1,  0,  1,  0,  0, 1],  # 8
-        [-1,  1,  1,  0,  1,  0,  0, 0],  # 9
-        [ 1,  1,  1,  0,  1,  0,  1, 0],  # 10
-        [ 1,  1, -1,  0,  1,  0,  1, 1],  # 11
-        
-        # Bottom face
-        [-1, -1, -1,  0, -1,  0,  1, 1],  # 12
-        [ 1, -1, -1,  0, -1,  0,  0, 1],  # 13
-        [ 1, -1,  1,  0, -1,  0,  0, 0],  # 14
-        [-1, -1,  1,  0, -1,  0,  1, 0],  # 15
-        
-        # Right face
-        [ 1, -1, -1,  1,  0,  0,  1, 0],  # 16
-        [ 1,  1, -1,  1,  0,  0,  1, 1],  # 17
-        [ 1,  1,  1,  1,  0,  0,  0, 1],  # 18
-        [ 1, -1,  1,  1,  0,  0,  0, 0],  # 19
-        
-        # Left face
-        [-1, -1, -1, -1,  0,  0,  0, 0],  # 20
-        [-1, -1,  1, -1,  0,  0,  1, 0],  # 21
-        [-1,  1,  1, -1,  0,  0,  1, 1],  # 22
-        [-1,  1, -1, -1,  0,  0,  0, 1],  # 23
-    ]
-    
-    # Cube indices (triangles)
-    indices = [
-        # Front face
-        0, 1, 2,   2, 3, 0,
-        # Back face
-        4, 5, 6,   6, 7, 4,
-        # Top face
-        8, 9, 10,  10, 11, 8,
-        # Bottom face
-        12, 13, 14, 14, 15, 12,
-        # Right face
-        16, 17, 18, 18, 19, 16,
-        # Left face
-        20, 21, 22, 22, 23, 20,
-    ]
+import numpy as np
+
+# Text outputs are written with one large buffer so each needs a single write syscall
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Binary glTF header (magic, version, total length) and chunk header (length, type)
+_GLB_HEADER = struct.Struct('<4sII')
+_GLB_CHUNK_HEADER = struct.Struct('<I4s')
+
+# Unit cube template shared by the cube and mech models (positions, normals, texture coordinates)
+_CUBE_V = np.array([
+    # Front face
+    [-1, -1,  1,  0,  0,  1,  0, 0],
+    [ 1, -1,  1,  0,  0,  1,  1, 0],
+    [ 1,  1,  1,  0,  0,  1,  1, 1],
+    [-1,  1,  1,  0,  0,  1,  0, 1],
+    # Back face
+    [-1, -1, -1,  0,  0, -1,  1, 0],
+    [-1,  1, -1,  0,  0, -1,  1, 1],
+    [ 1,  1, -1,  0,  0, -1,  0, 1],
+    [ 1, -1, -1,  0,  0, -1,  0, 0],
+    # Top face
+    [-1,  1, -1,  0,  1,  0,  0, 1],
+    [-1,  1,  1,  0,  1,  0,  0, 0],
+    [ 1,  1,  1,  0,  1,  0,  1, 0],
+    [ 1,  1, -1,  0,  1,  0,  1, 1],
+    # Bottom face
+    [-1, -1, -1,  0, -1,  0,  1, 1],
+    [ 1, -1, -1,  0, -1,  0,  0, 1],
+    [ 1, -1,  1,  0, -1,  0,  0, 0],
+    [-1, -1,  1,  0, -1,  0,  1, 0],
+    # Right face
+    [ 1, -1, -1,  1,  0,  0,  1, 0],
+    [ 1,  1, -1,  1,  0,  0,  1, 1],
+    [ 1,  1,  1,  1,  0,  0,  0, 1],
+    [ 1, -1,  1,  1,  0,  0,  0, 0],
+    # Left face
+    [-1, -1, -1, -1,  0,  0,  0, 0],
+    [-1, -1,  1, -1,  0,  0,  1, 0],
+    [-1,  1,  1, -1,  0,  0,  1, 1],
+    [-1,  1, -1, -1,  0,  0,  0, 1],
+], dtype=np.float64)
+
+# Two triangles per quad face (a, a+1, a+2, a+2, a+3, a)
+_QUAD_PATTERN = np.array([0, 1, 2, 2, 3, 0], dtype=np.int64)
+
+def _quad_indices(face_count):
+    """Return little-endian 16-bit triangle indices for quads of four consecutive vertices"""
+    # Every vertex must be addressable by a 16-bit index
+    if 4 * face_count > 65536:
+        raise ValueError(f"{face_count} quad faces need {4 * face_count} vertices, "
+                         f"more than 16-bit indices can address (65536)")
+    
+    # Build in a wide type so nothing wraps, then narrow for the buffer
+    bases = np.arange(0, 4 * face_count, 4, dtype=np.int64)[:, None]
+    return (bases + _QUAD_PATTERN).ravel().astype('<u2')
+
+_CUBE_I = _quad_indices(6)
+
+# Serialization-ready copies of the template, built once at import
+_CUBE_V_F32 = _CUBE_V.astype('<f4')  # Little-endian floats
+_CUBE_I.setflags(write=False)
+_CUBE_V_F32.setflags(write=False)
+
+# The same cube with each corner stored once (position only), for pipelines
+# that derive flat normals in the fragment shader. Remapping the template
+# indices keeps the original per-face winding
+_CUBE_SHARED_P, _corner_of = np.unique(_CUBE_V[:, :3], axis=0, return_inverse=True)
+_CUBE_SHARED_I = _corner_of.reshape(-1)[_CUBE_I].astype('<u2')
+_CUBE_SHARED_P = _CUBE_SHARED_P.astype('<f4')
+_CUBE_SHARED_P.setflags(write=False)
+_CUBE_SHARED_I.setflags(write=False)
+del _corner_of
+
+# Mech damage zones: (id suffix, name, type, max armor, max internal,
+# bounds min, bounds max, total slots, destruction effects, armor scales with size)
+_ZONE_SPECS = [
+    ("head", "Head", "HEAD", 9.0, 3.0,
+     (-0.8, 4.0, -0.8), (0.8, 5.2, 0.8), 6,
+     ("cockpit_breach", "sensor_damage"), False),
+    ("center_torso", "Center Torso", "CENTER_TORSO", 20.0, 15.0,
+     (-1.5, 1.0, -1.0), (1.5, 3.0, 1.0), 12,
+     ("engine_shutdown", "mech_destruction"), True),
+    ("left_arm", "Left Arm", "LEFT_ARM", 12.0, 8.0,
+     (-2.2, 1.5, -0.6), (-0.8, 3.5, 0.6), 8,
+     ("weapon_loss", "actuator_damage"), True),
+    ("right_arm", "Right Arm", "RIGHT_ARM", 12.0, 8.0,
+     (0.8, 1.5, -0.6), (2.2, 3.5, 0.6), 8,
+     ("weapon_loss", "actuator_damage"), True),
+]
+
+def _align4(length):
+    """Round a byte length up to the next 4-byte boundary"""
+    return (length + 3) & ~3
+
+def _pack_buffer(*blocks):
+    """Pack numeric arrays into one buffer, each block aligned to 4 bytes.
+    
+    Returns the buffer bytes and the byte offset of every block.
+    """
+    offsets = []
+    buffer_length = 0
+    for block in blocks:
+        offsets.append(buffer_length)
+        buffer_length += _align4(block.nbytes)
+    
+    # Preallocate the whole buffer and copy each block into place. Assigning
+    # through a shaped view copies strided blocks (e.g. one attribute sliced
+    # out of interleaved vertices) directly, without a contiguous temporary
+    buffer_data = bytearray(buffer_length)
+    for block, offset in zip(blocks, offsets):
+        target = np.frombuffer(buffer_data, dtype=block.dtype, count=block.size, offset=offset)
+        target.reshape(block.shape)[...] = block
+    
+    return bytes(buffer_data), offsets
+
+def _normalized(values, dtype, components):
+    """Quantize values in [-1, 1] (or [0, 1]) to normalized integers, zero-padded to components"""
+    quantized = np.zeros((len(values), components), dtype=dtype)
+    quantized[:, :values.shape[1]] = np.round(values * np.iinfo(dtype).max)
+    return quantized
+
+def generate_cube_gltf(quantize=False):
+    """Generate a simple cube glTF file, optionally with KHR_mesh_quantization attributes"""
+    
+    # Cube vertices and indices come from the module-level template
+    vertex_array = _CUBE_V_F32
+    index_array = _CUBE_I
+    vertex_count = len(vertex_array)
+    index_count = len(index_array)
+    
+    # Split the attributes into separate contiguous blocks (no byteStride),
+    # so each one can be read as a flat array
+    positions = vertex_array[:, 0:3]
+    normals = vertex_array[:, 3:6]
+    tex_coords = vertex_array[:, 6:8]
+    
+    if quantize:
+        # Normalized SHORT positions, BYTE normals and UNSIGNED_SHORT UVs. Vertex
+        # attribute elements must be 4-byte aligned, so VEC3s are padded to 4
+        positions = _normalized(positions, '<i2', 4)
+        normals = _normalized(normals, '<i1', 4)
+        tex_coords = _normalized(tex_coords, '<u2', 2)
+    
+    # Position bounds, in the stored component type (skipping any padding)
+    min_pos = positions[:, :3].min(axis=0).tolist()
+    max_pos = positions[:, :3].max(axis=0).tolist()
     
     # Create binary buffer data
-    buffer_data = b''
-    
-    # Add vertex data
-    vertex_data_start = len(buffer_data)
-    for vertex in vertices:
-        for component in vertex:
-            buffer_data += struct.pack('<f', component)  # Little-endian float
-    
-    # Add index data (align to 4-byte boundary)
-    while len(buffer_data) % 4 != 0:
-        buffer_data += b'\x00'
-    
-    index_data_start = len(buffer_data)
-    for index in indices:
-        buffer_data += struct.pack('<H', index)  # Little-endian unsigned short
-    
-    # Align to 4-byte boundary
-    while len(buffer_data) % 4 != 0:
-        buffer_data += b'\x00'
+    buffer_data, (position_start, normal_start, tex_coord_start, index_data_start) = _pack_buffer(
+        positions, normals, tex_coords, index_array)
     
     buffer_length = len(buffer_data)
     
@@ -142,50 +219,63 @@ def generate_cube_gltf():
                 "bufferView": 0,
                 "byteOffset": 0,
                 "componentType": 5126,  # FLOAT
-                "count": 24,
+                "count": vertex_count,
                 "type": "VEC3",
-                "min": [-1, -1, -1],
-                "max": [1, 1, 1]
+                "min": min_pos,
+                "max": max_pos
             },
             {
                 "name": "Normal Accessor",
-                "bufferView": 0,
-                "byteOffset": 12,  # 3 * sizeof(float)
+                "bufferView": 1,
+                "byteOffset": 0,
                 "componentType": 5126,  # FLOAT
-                "count": 24,
+                "count": vertex_count,
                 "type": "VEC3"
             },
             {
                 "name": "TexCoord Accessor",
-                "bufferView": 0,
-                "byteOffset": 24,  # 6 * sizeof(float)
+                "bufferView": 2,
+                "byteOffset": 0,
                 "componentType": 5126,  # FLOAT
-                "count": 24,
+                "count": vertex_count,
                 "type": "VEC2"
             },
             {
                 "name": "Index Accessor",
-                "bufferView": 1,
+                "bufferView": 3,
                 "byteOffset": 0,
                 "componentType": 5123,  # UNSIGNED_SHORT
-                "count": 36,
+                "count": index_count,
                 "type": "SCALAR"
             }
         ],
         "bufferViews": [
             {
-                "name": "Vertex Buffer View",
+                "name": "Position Buffer View",
                 "buffer": 0,
-                "byteOffset": vertex_data_start,
-                "byteLength": 24 * 8 * 4,  # 24 vertices * 8 components * 4 bytes
-                "byteStride": 32,  # 8 components * 4 bytes
+                "byteOffset": position_start,
+                "byteLength": positions.nbytes,  # vertices * 3 components * 4 bytes (float)
+                "target": 34962  # ARRAY_BUFFER
+            },
+            {
+                "name": "Normal Buffer View",
+                "buffer": 0,
+                "byteOffset": normal_start,
+                "byteLength": normals.nbytes,  # vertices * 3 components * 4 bytes (float)
+                "target": 34962  # ARRAY_BUFFER
+            },
+            {
+                "name": "TexCoord Buffer View",
+                "buffer": 0,
+                "byteOffset": tex_coord_start,
+                "byteLength": tex_coords.nbytes,  # vertices * 2 components * 4 bytes (float)
                 "target": 34962  # ARRAY_BUFFER
             },
             {
                 "name": "Index Buffer View",
                 "buffer": 0,
                 "byteOffset": index_data_start,
-                "byteLength": 36 * 2,  # 36 indices * 2 bytes
+                "byteLength": index_array.nbytes,  # indices * 2 bytes
                 "target": 34963  # ELEMENT_ARRAY_BUFFER
             }
         ],
@@ -198,10 +288,130 @@ def generate_cube_gltf():
         ]
     }
     
+    if quantize:
+        accessors = gltf["accessors"]
+        accessors[0].update(componentType=5122, normalized=True)  # SHORT
+        accessors[1].update(componentType=5120, normalized=True)  # BYTE
+        accessors[2].update(componentType=5123, normalized=True)  # UNSIGNED_SHORT
+        for view, stride in zip(gltf["bufferViews"], (8, 4, 4)):
+            view["byteStride"] = stride
+        gltf["extensionsUsed"] = ["KHR_mesh_quantization"]
+        gltf["extensionsRequired"] = ["KHR_mesh_quantization"]
+    
+    return gltf, buffer_data
+
+def generate_cube_gltf_shared():
+    """Generate a cube glTF file with 8 shared, position-only vertices"""
+    
+    positions = _CUBE_SHARED_P
+    index_array = _CUBE_SHARED_I
+    min_pos = positions.min(axis=0).tolist()
+    max_pos = positions.max(axis=0).tolist()
+    
+    # Create binary buffer data
+    buffer_data, (position_start, index_data_start) = _pack_buffer(positions, index_array)
+    
+    # Create the glTF JSON
+    gltf = {
+        "asset": {
+            "version": "2.0",
+            "generator": "CorePulse Test Generator"
+        },
+        "scene": 0,
+        "scenes": [
+            {
+                "name": "Test Scene",
+                "nodes": [0]
+            }
+        ],
+        "nodes": [
+            {
+                "name": "Cube",
+                "mesh": 0,
+                "translation": [0, 0, 0],
+                "rotation": [0, 0, 0, 1],
+                "scale": [1, 1, 1]
+            }
+        ],
+        "meshes": [
+            {
+                "name": "Shared Cube Mesh",
+                "primitives": [
+                    {
+                        "attributes": {
+                            "POSITION": 0
+                        },
+                        "indices": 1,
+                        "material": 0
+                    }
+                ]
+            }
+        ],
+        "materials": [
+            {
+                "name": "Default Material",
+                "pbrMetallicRoughness": {
+                    "baseColorFactor": [0.8, 0.2, 0.2, 1.0],
+                    "metallicFactor": 0.1,
+                    "roughnessFactor": 0.8
+                },
+                # No NORMAL attribute: shade with face normals derived from
+                # screen-space derivatives (GL_OES_standard_derivatives)
+                "extras": {
+                    "flat_shading": True
+                }
+            }
+        ],
+        "accessors": [
+            {
+                "name": "Position Accessor",
+                "bufferView": 0,
+                "byteOffset": 0,
+                "componentType": 5126,  # FLOAT
+                "count": len(positions),
+                "type": "VEC3",
+                "min": min_pos,
+                "max": max_pos
+            },
+            {
+                "name": "Index Accessor",
+                "bufferView": 1,
+                "byteOffset": 0,
+                "componentType": 5123,  # UNSIGNED_SHORT
+                "count": len(index_array),
+                "type": "SCALAR"
+            }
+        ],
+        "bufferViews": [
+            {
+                "name": "Position Buffer View",
+                "buffer": 0,
+                "byteOffset": position_start,
+                "byteLength": positions.nbytes,  # vertices * 3 components * 4 bytes
+                "target": 34962  # ARRAY_BUFFER
+            },
+            {
+                "name": "Index Buffer View",
+                "buffer": 0,
+                "byteOffset": index_data_start,
+                "byteLength": index_array.nbytes,  # indices * 2 bytes
+                "target": 34963  # ELEMENT_ARRAY_BUFFER
+            }
+        ],
+        "buffers": [
+            {
+                "name": "Cube Buffer",
+                "uri": "cube_shared.bin",
+                "byteLength": len(buffer_data)
+            }
+        ]
+    }
+    
     return gltf, buffer_data
 
 def generate_simple_mech_gltf(name, color, scale_factor=1.0):
     """Generate a simple mech-like model using basic shapes"""
+    slug = name.lower().replace(' ', '_')
     
     # Simple mech structure: main body (cube) + legs (smaller cubes)
     vertices = []
@@ -210,61 +420,15 @@ def generate_simple_mech_gltf(name, color, scale_factor=1.0):
     
     def add_cube_at_position(pos, scale, vertices, indices, vertex_offset):
         """Add a cube at a specific position and scale"""
-        base_vertices = [
-            # Front face
-            [-1, -1,  1,  0,  0,  1,  0, 0],
-            [ 1, -1,  1,  0,  0,  1,  1, 0],
-            [ 1,  1,  1,  0,  0,  1,  1, 1],
-            [-1,  1,  1,  0,  0,  1,  0, 1],
-            # Back face
-            [-1, -1, -1,  0,  0, -1,  1, 0],
-            [-1,  1, -1,  0,  0, -1,  1, 1],
-            [ 1,  1, -1,  0,  0, -1,  0, 1],
-            [ 1, -1, -1,  0,  0, -1,  0, 0],
-            # Top face
-            [-1,  1, -1,  0,  1,  0,  0, 1],
-            [-1,  1,  1,  0,  1,  0,  0, 0],
-            [ 1,  1,  1,  0,  1,  0,  1, 0],
-            [ 1,  1, -1,  0,  1,  0,  1, 1],
-            # Bottom face
-            [-1, -1, -1,  0, -1,  0,  1, 1],
-            [ 1, -1, -1,  0, -1,  0,  0, 1],
-            [ 1, -1,  1,  0, -1,  0,  0, 0],
-            [-1, -1,  1,  0, -1,  0,  1, 0],
-            # Right face
-            [ 1, -1, -1,  1,  0,  0,  1, 0],
-            [ 1,  1, -1,  1,  0,  0,  1, 1],
-            [ 1,  1,  1,  1,  0,  0,  0, 1],
-            [ 1, -1,  1,  1,  0,  0,  0, 0],
-            # Left face
-            [-1, -1, -1, -1,  0,  0,  0, 0],
-            [-1, -1,  1, -1,  0,  0,  1, 0],
-            [-1,  1,  1, -1,  0,  0,  1, 1],
-            [-1,  1, -1, -1,  0,  0,  0, 1],
-        ]
-        
-        # Transform vertices
-        for vertex in base_vertices:
-            new_vertex = [
-                vertex[0] * scale[0] + pos[0],  # X position
-                vertex[1] * scale[1] + pos[1],  # Y position  
-                vertex[2] * scale[2] + pos[2],  # Z position
-                vertex[3], vertex[4], vertex[5],  # Normal
-                vertex[6], vertex[7]  # UV
-            ]
-            vertices.append(new_vertex)
+        # Transform template positions, keep normals and UVs
+        cube = _CUBE_V.copy()
+        cube[:, :3] = cube[:, :3] * np.asarray(scale) + np.asarray(pos)
+        vertices.append(cube)
         
         # Add indices with offset
-        cube_indices = [
-            0, 1, 2,   2, 3, 0,    4, 5, 6,   6, 7, 4,
-            8, 9, 10,  10, 11, 8,  12, 13, 14, 14, 15, 12,
-            16, 17, 18, 18, 19, 16, 20, 21, 22, 22, 23, 20,
-        ]
+        indices.append(_CUBE_I + vertex_offset)
         
-        for idx in cube_indices:
-            indices.append(idx + vertex_offset)
-        
-        return vertex_offset + 24
+        return vertex_offset + len(_CUBE_V)
     
     # Main body (torso)
     vertex_offset = add_cube_at_position([0, 2, 0], [1.5, 2, 1], vertices, indices, vertex_offset)
@@ -278,48 +442,33 @@ def generate_simple_mech_gltf(name, color, scale_factor=1.0):
     # Head/Cockpit
     vertex_offset = add_cube_at_position([0, 4.5, 0.3], [0.8, 0.8, 0.8], vertices, indices, vertex_offset)
     
+    vertices = np.concatenate(vertices)
+    indices = np.concatenate(indices)
+    
     # Scale entire model
     if scale_factor != 1.0:
-        for vertex in vertices:
-            vertex[0] *= scale_factor
-            vertex[1] *= scale_factor  
-            vertex[2] *= scale_factor
+        vertices[:, :3] *= scale_factor
     
     # Create binary buffer data
-    buffer_data = b''
-    
-    # Add vertex data
-    vertex_data_start = len(buffer_data)
-    for vertex in vertices:
-        for component in vertex:
-            buffer_data += struct.pack('<f', component)
-    
-    # Add index data (align to 4-byte boundary)
-    while len(buffer_data) % 4 != 0:
-        buffer_data += b'\x00'
-    
-    index_data_start = len(buffer_data)
-    for index in indices:
-        buffer_data += struct.pack('<H', index)
-    
-    # Align to 4-byte boundary
-    while len(buffer_data) % 4 != 0:
-        buffer_data += b'\x00'
+    buffer_data, (vertex_data_start, index_data_start) = _pack_buffer(
+        np.asarray(vertices, dtype='<f4'),
+        np.asarray(indices, dtype='<u2'),
+    )
     
     buffer_length = len(buffer_data)
     vertex_count = len(vertices)
     index_count = len(indices)
     
     # Calculate bounds
-    positions = [[v[0], v[1], v[2]] for v in vertices]
-    min_pos = [min(p[i] for p in positions) for i in range(3)]
-    max_pos = [max(p[i] for p in positions) for i in range(3)]
+    positions = vertices[:, :3]
+    min_pos = positions.min(axis=0).tolist()
+    max_pos = positions.max(axis=0).tolist()
     
     # Create mech-specific extensions
     hardpoints_extension = {
         "hardpoints": [
             {
-                "id": f"{name.lower().replace(' ', '_')}_arm_energy_1",
+                "id": f"{slug}_arm_energy_1",
                 "name": "Left Arm Energy Hardpoint",
                 "type": "ENERGY",
                 "size": "MEDIUM",
@@ -330,7 +479,7 @@ def generate_simple_mech_gltf(name, color, scale_factor=1.0):
                 "attachment_node": "left_arm_mount"
             },
             {
-                "id": f"{name.lower().replace(' ', '_')}_arm_ballistic_1",
+                "id": f"{slug}_arm_ballistic_1",
                 "name": "Right Arm Ballistic Hardpoint",
                 "type": "BALLISTIC",
                 "size": "LARGE" if scale_factor > 1.2 else "MEDIUM",
@@ -346,49 +495,18 @@ def generate_simple_mech_gltf(name, color, scale_factor=1.0):
     damage_zones_extension = {
         "zones": [
             {
-                "id": f"{name.lower().replace(' ', '_')}_head",
-                "name": "Head",
-                "type": "HEAD",
-                "max_armor": 9.0,
-                "max_internal": 3.0,
-                "bounds_min": [-0.8 * scale_factor, 4.0 * scale_factor, -0.8 * scale_factor],
-                "bounds_max": [0.8 * scale_factor, 5.2 * scale_factor, 0.8 * scale_factor],
-                "total_slots": 6,
-                "destruction_effects": ["cockpit_breach", "sensor_damage"]
-            },
-            {
-                "id": f"{name.lower().replace(' ', '_')}_center_torso",
-                "name": "Center Torso",
-                "type": "CENTER_TORSO",
-                "max_armor": 20.0 * scale_factor,
-                "max_internal": 15.0 * scale_factor,
-                "bounds_min": [-1.5 * scale_factor, 1.0 * scale_factor, -1.0 * scale_factor],
-                "bounds_max": [1.5 * scale_factor, 3.0 * scale_factor, 1.0 * scale_factor],
-                "total_slots": 12,
-                "destruction_effects": ["engine_shutdown", "mech_destruction"]
-            },
-            {
-                "id": f"{name.lower().replace(' ', '_')}_left_arm",
-                "name": "Left Arm",
-                "type": "LEFT_ARM",
-                "max_armor": 12.0 * scale_factor,
-                "max_internal": 8.0 * scale_factor,
-                "bounds_min": [-2.2 * scale_factor, 1.5 * scale_factor, -0.6 * scale_factor],
-                "bounds_max": [-0.8 * scale_factor, 3.5 * scale_factor, 0.6 * scale_factor],
-                "total_slots": 8,
-                "destruction_effects": ["weapon_loss", "actuator_damage"]
-            },
-            {
-                "id": f"{name.lower().replace(' ', '_')}_right_arm",
-                "name": "Right Arm", 
-                "type": "RIGHT_ARM",
-                "max_armor": 12.0 * scale_factor,
-                "max_internal": 8.0 * scale_factor,
-                "bounds_min": [0.8 * scale_factor, 1.5 * scale_factor, -0.6 * scale_factor],
-                "bounds_max": [2.2 * scale_factor, 3.5 * scale_factor, 0.6 * scale_factor],
-                "total_slots": 8,
-                "destruction_effects": ["weapon_loss", "actuator_damage"]
+                "id": f"{slug}_{zone_id}",
+                "name": zone_name,
+                "type": zone_type,
+                "max_armor": armor * (scale_factor if scales_armor else 1.0),
+                "max_internal": internal * (scale_factor if scales_armor else 1.0),
+                "bounds_min": [x * scale_factor for x in bounds_min],
+                "bounds_max": [x * scale_factor for x in bounds_max],
+                "total_slots": slots,
+                "destruction_effects": list(effects)
             }
+            for (zone_id, zone_name, zone_type, armor, internal,
+                 bounds_min, bounds_max, slots, effects, scales_armor) in _ZONE_SPECS
         ]
     }
 
@@ -496,7 +614,7 @@ def generate_simple_mech_gltf(name, color, scale_factor=1.0):
         "buffers": [
             {
                 "name": f"{name} Buffer",
-                "uri": f"{name.lower().replace(' ', '_')}.bin",
+                "uri": f"{slug}.bin",
                 "byteLength": buffer_length
             }
         ],
@@ -507,30 +625,173 @@ def generate_simple_mech_gltf(name, color, scale_factor=1.0):
         "extensionsUsed": ["CP_walker_hardpoints", "CP_damage_zones"]
     }
     
-    print(f"DEBUG: About to return glTF for {name} with keys: {list(gltf.keys())}")
-    print(f"DEBUG: Extensions present: {'extensions' in gltf}")
+    return gltf, buffer_data, slug
+
+def _write_gltf(path, gltf, pretty=False):
+    """Write a glTF JSON document, compact unless pretty output is requested"""
+    if pretty:
+        text = json.dumps(gltf, indent=2)
+    else:
+        text = json.dumps(gltf, separators=(',', ':'), ensure_ascii=False)
+    
+    # Serialize first, then hand the whole document to a single write
+    with open(path, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
+        f.write(text)
+
+@contextlib.contextmanager
+def _mapped_output(path, length):
+    """Create or truncate a file of the given length and map it for writing"""
+    fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.ftruncate(fd, length)
+        with mmap.mmap(fd, length) as mm:
+            yield mm
+    finally:
+        os.close(fd)
+
+def _write_binary(path, data):
+    """Write a binary file by copying the data into its mapped pages"""
+    if not data:
+        # Empty files cannot be mapped
+        open(path, 'wb').close()
+        return
+    
+    with _mapped_output(path, len(data)) as mm:
+        mm[:] = data
+
+def _write_glb(path, gltf, buffer_data):
+    """Write a glTF document and its buffer as a single binary .glb file"""
+    # The buffer lives in the BIN chunk, so it has no uri
+    buffers = [{key: value for key, value in buffer.items() if key != "uri"}
+               for buffer in gltf["buffers"]]
+    json_chunk = json.dumps(dict(gltf, buffers=buffers), separators=(',', ':'),
+                            ensure_ascii=False).encode('utf-8')
+    json_chunk += b' ' * (_align4(len(json_chunk)) - len(json_chunk))
+    bin_length = _align4(len(buffer_data))
+    
+    json_start = _GLB_HEADER.size + _GLB_CHUNK_HEADER.size
+    bin_start = json_start + len(json_chunk) + _GLB_CHUNK_HEADER.size
+    glb_length = bin_start + bin_length
+    
+    # Pack the header and both chunks straight into the mapped file; the
+    # zero-filled file already provides the BIN chunk padding
+    with _mapped_output(path, glb_length) as mm:
+        _GLB_HEADER.pack_into(mm, 0, b'glTF', 2, glb_length)
+        _GLB_CHUNK_HEADER.pack_into(mm, _GLB_HEADER.size, len(json_chunk), b'JSON')
+        mm[json_start:json_start + len(json_chunk)] = json_chunk
+        _GLB_CHUNK_HEADER.pack_into(mm, bin_start - _GLB_CHUNK_HEADER.size, bin_length, b'BIN\x00')
+        mm[bin_start:bin_start + len(buffer_data)] = buffer_data
+
+def _write_model(directory, filename, gltf, buffer_data, args):
+    """Write a model as a .gltf/.bin pair, or as a single .glb with --glb"""
+    if args.glb:
+        _write_glb(f"{directory}/{filename}.glb", gltf, buffer_data)
+        return
+    
+    if args.compress:
+        # Optional dependency, availability is checked in main()
+        import blosc
+        
+        # Ship a Blosc-compressed copy of the buffer next to the raw one
+        compressed_uri = f"{filename}.bin.blosc"
+        gltf["buffers"][0]["extras"] = {"compressed_uri": compressed_uri, "compression": "blosc-lz4"}
+        _write_binary(f"{directory}/{compressed_uri}",
+                      blosc.compress(buffer_data, typesize=4, cname='lz4', clevel=5))
+    
+    _write_gltf(f"{directory}/{filename}.gltf", gltf, args.pretty)
+    _write_binary(f"{directory}/{filename}.bin", buffer_data)
+
+def _is_up_to_date(paths, stamp_path, options):
+    """Return True if every output is newer than this script and was written with options"""
+    script_mtime = os.path.getmtime(__file__)
+    if not all(os.path.exists(path) and os.path.getmtime(path) > script_mtime
+               for path in paths + [stamp_path]):
+        return False
+    
+    try:
+        with open(stamp_path, encoding='utf-8') as f:
+            return json.load(f) == options
+    except (OSError, ValueError):
+        return False
+
+def _make_one_mech(config):
+    """Generate one mech model and write its files"""
+    name, color, scale, walkers_dir, args = config
+    print(f"Generating {name}...")
+    mech_gltf, mech_buffer, filename = generate_simple_mech_gltf(name, color, scale)
     
-    return gltf, buffer_data
+    _write_model(walkers_dir, filename, mech_gltf, mech_buffer, args)
 
 def main():
+    parser = argparse.ArgumentParser(description="Generate test glTF files for CorePulse")
+    parser.add_argument("--pretty", action="store_true",
+                        default=os.environ.get("CP_PRETTY_GLTF", "").lower() in ("1", "true", "yes"),
+                        help="write indented, human-readable glTF JSON "
+                             "(also enabled by CP_PRETTY_GLTF=1, true or yes)")
+    parser.add_argument("--glb", action="store_true",
+                        help="write single-file binary .glb models instead of .gltf + .bin")
+    parser.add_argument("--compress", action="store_true",
+                        help="also write a Blosc-compressed copy of each .bin buffer "
+                             "(requires the blosc package)")
+    parser.add_argument("--quantize", action="store_true",
+                        help="store the cube and weapon attributes as normalized integers "
+                             "(KHR_mesh_quantization; the CorePulse loader reads FLOAT only)")
+    parser.add_argument("--force", action="store_true",
+                        help="regenerate even if the outputs are up to date")
+    args = parser.parse_args()
+    
+    if args.compress:
+        if args.glb:
+            parser.error("--compress applies to .bin buffers and cannot be combined with --glb")
+        try:
+            import blosc  # noqa: F401
+        except ImportError:
+            parser.error("--compress requires the blosc package (pip install blosc)")
+    
     # Create assets/models directory structure
     models_dir = "../assets/models"
     walkers_dir = f"{models_dir}/walkers"
     weapons_dir = f"{models_dir}/weapons"
     
-    os.makedirs(models_dir, exist_ok=True)
+    # The models are a pure function of this script and the output options,
+    # so skip the work if every output is newer than the script and the stamp
+    # left by the last run records the same options
+    options = {"pretty": args.pretty, "glb": args.glb,
+               "compress": args.compress, "quantize": args.quantize}
+    stamp_path = f"{models_dir}/.generate_test_gltf.json"
+    ext = "glb" if args.glb else "gltf"
+    models = [
+        f"{models_dir}/cube",
+        f"{models_dir}/cube_shared",
+        f"{walkers_dir}/light_mech",
+        f"{walkers_dir}/medium_mech",
+        f"{walkers_dir}/heavy_mech",
+        f"{weapons_dir}/laser_cannon",
+    ]
+    outputs = [f"{model}.{ext}" for model in models]
+    if not args.glb:
+        outputs += [f"{model}.bin" for model in models]
+    if args.compress:
+        outputs += [f"{model}.bin.blosc" for model in models]
+    if not args.force and _is_up_to_date(outputs, stamp_path, options):
+        print("Test glTF files are up to date (use --force to regenerate)")
+        return
+    
+    # Creating the leaf directories creates models_dir as well
     os.makedirs(walkers_dir, exist_ok=True)
     os.makedirs(weapons_dir, exist_ok=True)
     
     print("Generating test glTF files for CorePulse...")
     
     # Generate basic cube (for testing)
-    cube_gltf, cube_buffer = generate_cube_gltf()
+    cube_gltf, cube_buffer = generate_cube_gltf(args.quantize)
+    
+    _write_model(models_dir, "cube", cube_gltf, cube_buffer, args)
     
-    with open(f"{models_dir}/cube.gltf", 'w') as f:
-        json.dump(cube_gltf, f, indent=2)
-    with open(f"{models_dir}/cube.bin", 'wb') as f:
-        f.write(cube_buffer)
+    # Shared-vertex cube for renderers that compute flat normals themselves
+    shared_gltf, shared_buffer = generate_cube_gltf_shared()
+    
+    _write_model(models_dir, "cube_shared", shared_gltf, shared_buffer, args)
     
     # Generate test mech models
     mech_configs = [
@@ -539,42 +800,12 @@ def main():
         ("Heavy Mech", [0.8, 0.2, 0.2, 1.0], 1.3),   # Red, larger
     ]
     
-    for name, color, scale in mech_configs:
-        print(f"Generating {name}...")
-        mech_gltf, mech_buffer = generate_simple_mech_gltf(name, color, scale)
-        
-        filename = name.lower().replace(' ', '_')
-        
-        # Debug: Write to a temporary file first
-        temp_file = f"/tmp/{filename}_debug.gltf"
-        with open(temp_file, 'w') as f:
-            json.dump(mech_gltf, f, indent=2)
-        
-        # Check the temp file
-        with open(temp_file, 'r') as f:
-            temp_content = f.read()
-            has_extensions = "extensions" in temp_content
-            print(f"Temp file for {filename} has extensions: {has_extensions}")
-        
-        with open(f"{walkers_dir}/{filename}.gltf", 'w') as f:
-            # Debug: Print the keys in the glTF object before writing
-            print(f"glTF keys for {filename}: {list(mech_gltf.keys())}")
-            json.dump(mech_gltf, f, indent=2)
-        with open(f"{walkers_dir}/{filename}.bin", 'wb') as f:
-            f.write(mech_buffer)
-        
-        # Debug: Check if extensions are in the generated JSON
-        print(f"Extensions in {filename}: {'extensions' in mech_gltf}")
-        if 'extensions' in mech_gltf:
-            print(f"  Hardpoints: {'CP_walker_hardpoints' in mech_gltf['extensions']}")
-            print(f"  Damage zones: {'CP_damage_zones' in mech_gltf['extensions']}")
-            if 'CP_walker_hardpoints' in mech_gltf['extensions']:
-                print(f"  Hardpoint count: {len(mech_gltf['extensions']['CP_walker_hardpoints']['hardpoints'])}")
-            if 'CP_damage_zones' in mech_gltf['extensions']:
-                print(f"  Damage zone count: {len(mech_gltf['extensions']['CP_damage_zones']['zones'])}")
+    # Each mech writes its own files, so generate them in parallel
+    with ProcessPoolExecutor(max_workers=len(mech_configs)) as executor:
+        list(executor.map(_make_one_mech, [(*config, walkers_dir, args) for config in mech_configs]))
     
     # Generate simple weapon models
-    weapon_gltf, weapon_buffer = generate_cube_gltf()
+    weapon_gltf, weapon_buffer = generate_cube_gltf(args.quantize)
     # Modify for weapon (elongated cube)
     weapon_gltf["nodes"][0]["name"] = "Laser Cannon"
     weapon_gltf["nodes"][0]["scale"] = [3.0, 0.3, 0.3]  # Long and thin
@@ -583,17 +814,19 @@ def main():
     weapon_gltf["materials"][0]["pbrMetallicRoughness"]["metallicFactor"] = 0.8
     weapon_gltf["buffers"][0]["uri"] = "laser_cannon.bin"
     
-    with open(f"{weapons_dir}/laser_cannon.gltf", 'w') as f:
-        json.dump(weapon_gltf, f, indent=2)
-    with open(f"{weapons_dir}/laser_cannon.bin", 'wb') as f:
-        f.write(weapon_buffer)
+    _write_model(weapons_dir, "laser_cannon", weapon_gltf, weapon_buffer, args)
+    
+    # Record the options last, so an interrupted run is never taken as current
+    with open(stamp_path, 'w', encoding='utf-8') as f:
+        json.dump(options, f)
     
     print(f"\nGenerated test glTF files:")
-    print(f"  {models_dir}/cube.gltf - Basic cube")
-    print(f"  {walkers_dir}/light_mech.gltf - Light mech")
-    print(f"  {walkers_dir}/medium_mech.gltf - Medium mech")  
-    print(f"  {walkers_dir}/heavy_mech.gltf - Heavy mech")
-    print(f"  {weapons_dir}/laser_cannon.gltf - Weapon model")
+    print(f"  {models_dir}/cube.{ext} - Basic cube")
+    print(f"  {models_dir}/cube_shared.{ext} - Cube with shared vertices (flat shading)")
+    print(f"  {walkers_dir}/light_mech.{ext} - Light mech")
+    print(f"  {walkers_dir}/medium_mech.{ext} - Medium mech")  
+    print(f"  {walkers_dir}/heavy_mech.{ext} - Heavy mech")
+    print(f"  {weapons_dir}/laser_cannon.{ext} - Weapon model")
     print(f"\nAssets ready for CorePulse AssetManager testing!")
 
 if __name__ == "__main__":